@@ -4,15 +4,49 @@ import requests
 import json
 import random
 import os
+import logging
 from pathlib import Path
 import threading
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, 
                            QWidget, QPushButton, QLabel, QComboBox, QTextEdit, 
                            QLineEdit, QMessageBox, QProgressBar, QSplitter, 
                            QTextBrowser)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
+from PyQt5.QtCore import Qt, QThread, QTimer, pyqtSignal
 from PyQt5.QtGui import QFont, QPixmap, QTextCharFormat, QTextCursor, QColor
 
+log = logging.getLogger(__name__)
+
+# Stylesheets (sidebar and content area share one sheet on the main window)
+_SS_MAIN = """
+    #Sidebar, #Sidebar QWidget {
+        background-color: #2c3e50;
+        border-right: 1px solid #34495e;
+    }
+    #Sidebar QPushButton {
+        background-color: #3498db;
+        color: white;
+        border: none;
+        padding: 8px;
+        border-radius: 4px;
+        font-weight: bold;
+    }
+    #Sidebar QPushButton:hover {
+        background-color: #2980b9;
+    }
+    #Sidebar QPushButton:disabled {
+        background-color: #7f8c8d;
+    }
+    #Sidebar QLabel {
+        color: #ecf0f1;
+    }
+    #Content, #Content QWidget {
+        background-color: #34495e;
+    }
+"""
+
+_SS_TITLE = "color: #3498db; margin: 20px;"
+_SS_LOADING_LABEL = "color: #ecf0f1;"
+
 class WorkerThread(QThread):
     finished = pyqtSignal(object)
     
@@ -59,9 +93,12 @@ class HeelTurnAdventure(QMainWindow):
         # Styling
         self.fixed_font = QFont("Courier New", 12)  # Fixed-width font
         self.monospace_font = QFont("Monaco", 11)  # Alternative monospace
+        self.title_font = QFont("Arial", 24, QFont.Bold)
+        self.loading_font = QFont("Arial", 14)
         
         self.setup_ui()
-        self.scan_available_stories()
+        # Scan once the event loop is running so the loading screen gets painted first
+        QTimer.singleShot(0, self.scan_available_stories)
         
     def setup_ui(self):
         central_widget = QWidget()
@@ -69,42 +106,18 @@ class HeelTurnAdventure(QMainWindow):
         
         main_layout = QHBoxLayout(central_widget)
         
+        self.setStyleSheet(_SS_MAIN)
+        
         # Sidebar
         self.sidebar = QWidget()
+        self.sidebar.setObjectName("Sidebar")
         self.sidebar.setMaximumWidth(300)
         self.sidebar_layout = QVBoxLayout(self.sidebar)
-        self.sidebar.setStyleSheet("""
-            QWidget {
-                background-color: #2c3e50;
-                border-right: 1px solid #34495e;
-            }
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                padding: 8px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-            QPushButton:disabled {
-                background-color: #7f8c8d;
-            }
-            QLabel {
-                color: #ecf0f1;
-            }
-        """)
         
         # Main content area
         self.content_area = QWidget()
+        self.content_area.setObjectName("Content")
         self.content_layout = QVBoxLayout(self.content_area)
-        self.content_area.setStyleSheet("""
-            QWidget {
-                background-color: #34495e;
-            }
-        """)
         
         splitter = QSplitter(Qt.Horizontal)
         splitter.addWidget(self.sidebar)
@@ -121,20 +134,20 @@ class HeelTurnAdventure(QMainWindow):
         self.clear_content()
         
         title = QLabel("Heel Turn")
-        title.setFont(QFont("Arial", 24, QFont.Bold))
+        title.setFont(self.title_font)
         title.setAlignment(Qt.AlignCenter)
-        title.setStyleSheet("color: #3498db; margin: 20px;")
+        title.setStyleSheet(_SS_TITLE)
         self.content_layout.addWidget(title)
         
         loading_label = QLabel("Scanning for stories...")
-        loading_label.setFont(QFont("Arial", 14))
+        loading_label.setFont(self.loading_font)
         loading_label.setAlignment(Qt.AlignCenter)
-        loading_label.setStyleSheet("color: #ecf0f1;")
+        loading_label.setStyleSheet(_SS_LOADING_LABEL)
         self.content_layout.addWidget(loading_label)
         
     def scan_available_stories(self):
         """Scan for available stories with improved path handling"""
-        print("Scanning for stories...")
+        log.debug("Scanning for stories...")
         self.available_stories = []  # Clear first
         
         # Try multiple possible data directory locations